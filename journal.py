@@ -8,16 +8,15 @@ from json import load as json_read, dump as json_write
 from argparse import ArgumentParser, Namespace
 from calendar import monthrange
 from collections import namedtuple, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from inspect import currentframe
 from itertools import chain, groupby
 from os import chdir as cd, chmod, environ, execvp, fork, wait
 from pathlib import Path
 from stat import S_IRUSR
-from statistics import mean, median, stdev
+from string import ascii_letters, digits
 from sys import stdout, exit as sys_exit
-from tarfile import open as open_tar_file, TarInfo
-from tempfile import mkstemp
 from typing import Any, Optional, Union, Callable, Generator, Iterable, Sequence, Mapping
 
 FILE_EXTENSION = '.journal'
@@ -31,6 +30,22 @@ DATE_LENGTH = STRING_LENGTHS['day']
 REFERENCE_REGEX = re.compile('[0-9]{4}-[0-9]{2}-[0-9]{2}')
 DATE_REGEX = re.compile(REFERENCE_REGEX.pattern + '(, (Mon|Tues|Wednes|Thurs|Fri|Satur|Sun)day)?')
 RANGE_BOUND_REGEX = re.compile('([0-9]{4}(-[0-9]{2}(-[0-9]{2})?)?)?')
+RANGE_REGEX = re.compile(RANGE_BOUND_REGEX.pattern + ':?' + RANGE_BOUND_REGEX.pattern)
+ASCII_REGEX = re.compile('(\t*[!-~]([ -~]*[!-~])?)?')
+ALPHA_REGEX = re.compile("[a-z']", flags=re.IGNORECASE)
+HYPHEN_REGEX = re.compile("([a-z']+(-[a-z']+)+)", flags=re.IGNORECASE)
+
+
+class _PunctTable(dict):
+    """A str.translate table that blanks characters not explicitly kept."""
+
+    def __missing__(self, codepoint):
+        # type: (int) -> str
+        return ' '
+
+
+PUNCT_TABLE = _PunctTable({ord(char): char for char in ascii_letters + digits + ' '})
+PUNCT_TABLE[ord("'")] = None
 
 
 class Title:
@@ -119,8 +134,10 @@ class Journal(Entries):
             self._check_metadata()
             self._read_cache()
         else:
-            for journal_file in self.journal_files:
-                self._read_file(journal_file)
+            with ThreadPoolExecutor() as executor:
+                # merge in submission order so later files win deterministically
+                for file_entries in executor.map(self._read_file, self.journal_files):
+                    self.entries.update(file_entries)
 
     def __len__(self):
         # type: () -> int
@@ -179,7 +196,8 @@ class Journal(Entries):
             self.update_metadata()
 
     def _read_file(self, filepath):
-        # type: (Path) -> None
+        # type: (Path) -> dict[Title, Entry]
+        entries = {} # type: dict[Title, Entry]
         with filepath.open() as fd:
             line_num = 1
             for raw_entry in fd.read().strip().split('\n\n'):
@@ -187,13 +205,14 @@ class Journal(Entries):
                     continue
                 lines = raw_entry.splitlines()
                 title = Title(lines[0])
-                self.entries[title] = Entry(
+                entries[title] = Entry(
                     title,
                     raw_entry,
                     filepath,
                     line_num,
                 )
                 line_num += len(lines) + 1
+        return entries
 
     def _read_cache(self):
         # type: () -> None
@@ -285,7 +304,6 @@ class Journal(Entries):
         # type: () -> list[tuple[Path, int, str]]
         """Check the journal for errors."""
         # pylint: disable = too-many-nested-blocks, too-many-branches
-        ascii_regex = re.compile('(\t*[!-~]([ -~]*[!-~])?)?')
         errors = []
         titles = set()
         long_dates = None
@@ -305,8 +323,8 @@ class Journal(Entries):
             prev_indent = 0
             prev_line = ''
             for line_num, line in enumerate(lines, start=1): # pylint: disable = unused-variable
-                indent = len(re.match('\t*', line)[0])
-                if not ascii_regex.fullmatch(line):
+                indent = len(line) - len(line.lstrip('\t'))
+                if not ASCII_REGEX.fullmatch(line):
                     errors.append(log_error(
                         'non-tab indentation, trailing whitespace, or non-ASCII character'
                     ))
@@ -483,9 +501,6 @@ def summarize_readability(entries, unit, num_words):
     Returns:
         str: The reading grade level.
     """
-    non_alnum_regex = re.compile('[^ 0-9A-Za-z]')
-    multispace_regex = re.compile('  +')
-
     def to_sentences(text):
         # type: (str) -> chain[str]
         for paragraph in text.splitlines():
@@ -498,10 +513,7 @@ def summarize_readability(entries, unit, num_words):
 
     def strip_punct(text):
         # type: (str) -> str
-        text = text.replace("'", '')
-        text = non_alnum_regex.sub(' ', text)
-        text = multispace_regex.sub(' ', text)
-        return text.strip()
+        return ' '.join(text.translate(PUNCT_TABLE).split())
 
     def letters_to_syllables(letters):
         # type: (int) -> float
@@ -609,6 +621,7 @@ def do_archive(_, args):
         args (Namespace): The CLI arguments.
     """
     from os.path import basename, join as join_path # pylint: disable = import-outside-toplevel
+    from tarfile import open as open_tar_file, TarInfo # pylint: disable = import-outside-toplevel
 
     def tarinfo_filter(tarinfo):
         # type: (TarInfo) -> Optional[TarInfo]
@@ -634,6 +647,8 @@ def do_count(journal, args):
         journal (Journal): The journal.
         args (Namespace): The CLI arguments.
     """
+    from statistics import mean, median, stdev # pylint: disable = import-outside-toplevel
+
     columns = {
         'DATE': (lambda entries, unit, num_words: unit),
         'COUNT': (lambda entries, unit, num_words: len(entries)),
@@ -768,6 +783,8 @@ def do_show(journal, args):
         journal (Journal): The journal.
         args (Namespace): The CLI arguments.
     """
+    from tempfile import mkstemp # pylint: disable = import-outside-toplevel
+
     entries = filter_entries(journal, args)
     if not entries:
         return
@@ -815,12 +832,10 @@ def do_wording(journal, args):
         entry.text for entry in
         filter_entries(journal, args, terms=None).values()
     )
-    alpha_regex = re.compile("[a-z']", flags=re.IGNORECASE)
     if args.terms:
         phrases = set(['-'.join(args.terms),])
     else:
-        hyphen_regex = re.compile("([a-z']+(-[a-z']+)+)", flags=re.IGNORECASE)
-        phrases = set(matches[0] for matches in hyphen_regex.finditer(journal_text))
+        phrases = set(matches[0] for matches in HYPHEN_REGEX.finditer(journal_text))
     matches = set(chain(*(
         re.finditer(r'[ -]?'.join(phrase.split('-')), journal_text, flags=re.IGNORECASE)
         for phrase in sorted(phrases)
@@ -834,9 +849,9 @@ def do_wording(journal, args):
         if variant in seen:
             continue
         if args.whole_words:
-            if alpha_regex.match(journal_text[match.start() - 1]):
+            if ALPHA_REGEX.match(journal_text[match.start() - 1]):
                 continue
-            if alpha_regex.match(journal_text[match.end()]):
+            if ALPHA_REGEX.match(journal_text[match.end()]):
                 continue
             term = r'\b' + re.escape(match.group()) + r'\b'
         else:
@@ -1087,10 +1102,9 @@ def process_args(arg_parser, args):
     if args.date_spec is None:
         args.date_ranges = None
     else:
-        range_regex = re.compile(RANGE_BOUND_REGEX.pattern + ':?' + RANGE_BOUND_REGEX.pattern)
         date_ranges = []
         for date_range in args.date_spec.split(','):
-            if not (len(date_range) > 1 and range_regex.fullmatch(date_range)):
+            if not (len(date_range) > 1 and RANGE_REGEX.fullmatch(date_range)):
                 arg_parser.error(
                     f'argument -d: "{date_range}" should be in format '
                     '[YYYY[-MM[-DD]]][:][YYYY[-MM[-DD]]][,...]'
@@ -3,7 +3,7 @@
 
 import re
 from csv import DictReader
-from itertools import chain
+from string import ascii_letters, digits
 from argparse import ArgumentParser
 from collections import defaultdict
 from inspect import signature, Parameter
@@ -59,16 +59,30 @@ BIBTEX_FIELDS = [
     'year',
 ]
 
+class _ScrubTable(dict):
+    """A str.translate table that deletes characters not explicitly kept."""
+
+    def __missing__(self, codepoint):
+        # type: (int) -> None
+        return None
+
+
+ALNUM_TABLE = _ScrubTable({ord(char): char for char in ascii_letters + digits})
+NAME_TABLE = _ScrubTable({ord(char): char for char in ascii_letters + ', '})
+
 class Paper:
     """A research paper."""
 
     __slots__ = (
         # library fields
         'library',
+        '_pdfinfo',
         # bibtex fields
         *BIBTEX_FIELDS,
     )
 
+    _BIBTEX_ATTRS = tuple(sorted(set(BIBTEX_FIELDS) - {'id', 'type'}))
+
     def __init__(self, paper_id, library=None):
         # type: (str, Optional[Library]) -> None
         """Initialize the Paper."""
@@ -109,11 +123,10 @@ class Paper:
         """Get a BibTex reference for the Paper."""
         lines = []
         lines.append(f'@{self.type} {{{self.id},')
-        for attr in sorted(self.__slots__):
-            if attr in ('id', 'type'):
-                continue
-            if hasattr(self, attr):
-                lines.append(f'    {attr} = {{{getattr(self, attr)}}},')
+        for attr in self._BIBTEX_ATTRS:
+            value = getattr(self, attr, None)
+            if value is not None:
+                lines.append(f'    {attr} = {{{value}}},')
         lines.append('}')
         return '\n'.join(lines)
 
@@ -133,12 +146,15 @@ class Paper:
     def remote(self):
         # type: () -> str
         """Get the URL of the remote file."""
-        return 'https://' + str(Path(REMOTE_HOST, 'papers', self.id[0].lower(), self.id + '.pdf'))
+        return f'https://{REMOTE_HOST}/papers/{self.id[0].lower()}/{self.id}.pdf'
 
     @property
     def pdfinfo(self):
         # type: () -> dict[str, str]
         """Read pdfinfo."""
+        cached = getattr(self, '_pdfinfo', None)
+        if cached is not None:
+            return cached
         if not self.local.exists():
             raise FileNotFoundError(self.local)
         pdfinfo = {}
@@ -146,6 +162,7 @@ class Paper:
             key, value = line.split(':', maxsplit=1)
             value = value.strip()
             pdfinfo[key] = value
+        self._pdfinfo = pdfinfo
         return pdfinfo
 
 
@@ -182,21 +199,29 @@ class Library:
             paper = None
             for line in fd:
                 line = line.rstrip()
-                if not line or re.fullmatch(r'\s*%.*', line):
+                if not line or line.lstrip().startswith('%'):
                     continue
                 if line.startswith('@'):
-                    match = re.fullmatch('@(?P<type>[^ ]+) *{(?P<id>[^,]+),', line)
-                    assert match, f'anomalous bibtex entry: {line}'
-                    paper = Paper(match.group('id'), library=self)
-                    paper.type = match.group('type')
+                    entry_type, brace, paper_id = line.partition('{')
+                    assert (
+                        brace and len(paper_id) > 1
+                        and paper_id.endswith(',') and ',' not in paper_id[:-1]
+                    ), f'anomalous bibtex entry: {line}'
+                    paper = Paper(paper_id[:-1], library=self)
+                    paper.type = entry_type[1:].rstrip()
                 elif line.startswith('}'):
                     self.papers[paper.id] = paper
                     paper = None
                 else:
-                    match = re.fullmatch(r'\s*(?P<attr>[^ =]+) *= *{(?P<val>.+)},', line)
-                    assert match, f'anomalous bibtex field: {line}'
-                    assert not hasattr(paper, match.group('attr')), f'{paper.id} has duplicate values for {match.group("attr")}'
-                    setattr(paper, match.group('attr'), match.group('val').strip())
+                    attr, equals, value = line.partition('=')
+                    attr = attr.strip()
+                    value = value.lstrip()
+                    assert (
+                        equals and attr and len(value) > 3
+                        and value.startswith('{') and value.endswith('},')
+                    ), f'anomalous bibtex field: {line}'
+                    assert not hasattr(paper, attr), f'{paper.id} has duplicate values for {attr}'
+                    setattr(paper, attr, value[1:-2].strip())
 
     # individual paper management
 
@@ -262,6 +287,21 @@ class Library:
     def lint(self): # pylint: disable = too-many-statements
         # type: () -> None
         """Lint the library bibtex file."""
+        name_regex = re.compile(' *(?P<first>[A-Z][^ ]*( +[A-Z][^ ]*)*) +(?P<last>.*) *')
+        group_author_regex = re.compile('({[^}]*}).*')
+        accent_regex = re.compile(r'\\.{(.)}')
+        multispace_regex = re.compile('  +')
+        unquoted_regexes = [
+            re.compile(r'(?P<word>[^ ]*[A-Za-z][A-Z][^ ]*)'),
+            re.compile(r'\? (?P<word>\w+)'),
+        ]
+        nested_regex = re.compile('{[^{}]*}')
+        word_strip_regex = re.compile(r'^\W*(.*?)\W*$')
+        ordinal_regex = re.compile('(.*[^0-9][0-9]+)(st|nd|rd|th)(.*)')
+        doi_regex = re.compile('.*?(10.*)')
+        pages_regex = re.compile('[A-Za-z]*[0-9]*')
+        non_pages_regex = re.compile('[^0-9-]')
+        unescaped_amp_regex = re.compile(r'([^\\])&')
 
         def check_names(key, paper):
             # type: (str, Paper) -> None
@@ -276,11 +316,9 @@ class Library:
                     return
                 people = value.split(' and ')
                 if any((',' not in person) for person in people if person not in WEIRD_NAMES):
-                    pattern = ' *(?P<first>[A-Z][^ ]*( +[A-Z][^ ]*)*) +(?P<last>.*) *'
                     suggestion = ' and '.join([
                         person.strip() if person in WEIRD_NAMES
-                        else re.sub(
-                            pattern,
+                        else name_regex.sub(
                             (lambda match: match.group('last') + ', ' + match.group('first')),
                             person.strip())
                         for person in people
@@ -304,19 +342,19 @@ class Library:
             else:
                 author = getattr(paper, 'editor')
             if author.startswith('{'):
-                first_author = re.sub('({[^}]*}).*', r'\1', author)
+                first_author = group_author_regex.sub(r'\1', author)
                 first_author = WEIRD_NAMES.get(first_author, first_author)
             else:
                 first_author = author.split(',')[0]
-                first_author = re.sub(r'\\.{(.)}', r'\1', first_author)
+                first_author = accent_regex.sub(r'\1', first_author)
             title = getattr(paper, 'title').title()
             year = getattr(paper, 'year')
             if year == 'FIXME':
                 return
             suggestion = f'{first_author}{year}{title}'
-            suggestion = re.sub('[^0-9A-Za-z]', '', suggestion)
+            suggestion = suggestion.translate(ALNUM_TABLE)
             short_suggestion = f'{first_author}{year}{"".join(title.split()[:3])}'
-            short_suggestion = re.sub('[^0-9A-Za-z]', '', short_suggestion)
+            short_suggestion = short_suggestion.translate(ALNUM_TABLE)
             suffices = ('', '1', '2', 'thesis')
             matches = False
             for suffix in suffices:
@@ -344,7 +382,7 @@ class Library:
                 if not hasattr(paper, attr):
                     continue
                 value = getattr(paper, attr)
-                new_value = re.sub('  +', ' ', value.strip())
+                new_value = multispace_regex.sub(' ', value.strip())
                 if value != new_value:
                     print(dedent(f'''
                         leading/trailing/multiple spaces in {attr} of {key}:
@@ -355,24 +393,20 @@ class Library:
         def check_capitalization(key, paper):
             # type: (str, Paper) -> None
             """Check for unquoted capitalizations."""
-            unquoted_regexes = [
-                r'(?P<word>[^ ]*[A-Za-z][A-Z][^ ]*)',
-                r'\? (?P<word>\w+)',
-            ]
             for attr in ['title', 'booktitle', 'journal']:
                 if not hasattr(paper, attr):
                     continue
                 title = getattr(paper, attr)
                 unnested_title = title
                 while '{' in unnested_title:
-                    unnested_title = re.sub('{[^{}]*}', '', unnested_title)
-                matches = list(chain(*(re.finditer(regex, unnested_title) for regex in unquoted_regexes)))
-                if not matches:
-                    continue
+                    unnested_title = nested_regex.sub('', unnested_title)
                 words = set(
-                    re.sub(r'^\W*(.*?)\W*$', r'\1', match.group('word'))
-                    for match in matches
+                    word_strip_regex.sub(r'\1', match.group('word'))
+                    for regex in unquoted_regexes
+                    for match in regex.finditer(unnested_title)
                 )
+                if not words:
+                    continue
                 new_title = title
                 for word in words:
                     new_title = re.sub(r'\b' + re.escape(word) + r'\b', '{' + word + '}', new_title)
@@ -393,7 +427,7 @@ class Library:
                 if not hasattr(paper, attr):
                     continue
                 val = getattr(paper, attr)
-                match = re.search('(.*[^0-9][0-9]+)(st|nd|rd|th)(.*)', val)
+                match = ordinal_regex.search(val)
                 if match:
                     suggestion = f'{match.group(1)}\\textsuperscript{{{match.group(2)}}}{match.group(3)}'
                     print(dedent(f'''
@@ -409,7 +443,7 @@ class Library:
                 return
             doi = getattr(paper, 'doi')
             if not doi.startswith('https://doi.org/'):
-                suggestion = re.sub('.*?(10.*)', r'\1', doi)
+                suggestion = doi_regex.sub(r'\1', doi)
                 print(dedent(f'''
                     DOI in non-URL format for {key}:
                         suggestion:
@@ -422,9 +456,9 @@ class Library:
             if not hasattr(paper, 'pages'):
                 return
             pages = getattr(paper, 'pages')
-            if pages == 'FIXME' or re.fullmatch('[A-Za-z]*[0-9]*', pages):
+            if pages == 'FIXME' or pages_regex.fullmatch(pages):
                 return
-            if re.search('[^0-9-]', pages):
+            if non_pages_regex.search(pages):
                 return
             if ' ' in pages or '--' not in pages:
                 if '-' in pages:
@@ -454,7 +488,7 @@ class Library:
                 if index == -1:
                     continue
                 if val[index - 1] != '\\':
-                    suggestion = re.sub(r'([^\\])&', r'\1\&', val)
+                    suggestion = unescaped_amp_regex.sub(r'\1\&', val)
                     print(dedent(f'''
                         {attr} field contains unescaped & for {key}
                             suggestion:
@@ -472,19 +506,26 @@ class Library:
             for pdf in unindexed_files:
                 print(f'no entry for file: {filenames[pdf]}')
 
+        checks = (
+            # (check, attributes the check reads; None to always run)
+            (check_names, ('author', 'editor')),
+            (check_id, None),
+            (check_spaces, None),
+            (check_capitalization, ('title', 'booktitle', 'journal')),
+            (check_ordinals, ('title', 'booktitle', 'journal')),
+            (check_doi, ('doi',)),
+            (check_pages, ('pages',)),
+            (check_latex, ('title', 'booktitle', 'journal')),
+        )
         for key, paper in self.papers.items():
-            check_names(key, paper)
-            check_id(key, paper)
-            check_spaces(key, paper)
-            check_capitalization(key, paper)
-            check_ordinals(key, paper)
-            check_doi(key, paper)
-            check_pages(key, paper)
-            check_latex(key, paper)
+            for check, attrs in checks:
+                if attrs is None or any(hasattr(paper, attr) for attr in attrs):
+                    check(key, paper)
         check_files()
 
     def toc(self, out_path=None):
         # type: (Optional[Path]) -> None
+        # pylint: disable = protected-access
         """Create an index HTML file of the library."""
         lines = ['''
             <!DOCTYPE html>
@@ -500,11 +541,10 @@ class Library:
             url = _get_url(paper_id)
             lines.append(f'<pre id="{paper_id}">')
             lines.append(f'@{paper_type} {{<a href="{url}">{paper_id}</a>,')
-            for attr in paper.__slots__:
-                if attr in ('library', 'id', 'type') or not hasattr(paper, attr):
-                    continue
-                value = getattr(paper, attr)
-                lines.append(f'    {attr} = {{{value}}},')
+            for attr in Paper._BIBTEX_ATTRS:
+                value = getattr(paper, attr, None)
+                if value is not None:
+                    lines.append(f'    {attr} = {{{value}}},')
             lines.append('}')
             lines.append('</pre>')
             lines.append('')
@@ -528,7 +568,7 @@ class Library:
             authors = getattr(paper, 'author').split(' and ')
             for author1 in authors:
                 for author2 in authors:
-                    author2 = re.sub('[^A-Za-z, ]', '', author2)
+                    author2 = author2.translate(NAME_TABLE)
                     coauthors[author1].append((author2, key))
         for author, coauthor_info in sorted(coauthors.items()):
             coauthor_info = sorted(coauthor_info)
@@ -670,7 +710,7 @@ class Library:
 def _get_url(filepath_str):
     # type: (str) -> str
     filepath = Path(filepath_str)
-    return 'https://' + str(Path(REMOTE_HOST, 'papers', filepath.name[0].lower(), filepath.stem + '.pdf'))
+    return f'https://{REMOTE_HOST}/papers/{filepath.name[0].lower()}/{filepath.stem}.pdf'
 
 
 def _run_shell_command(command, *args):